@@ -1,24 +1,50 @@
 # engine/audit.py
 # ------------------------------------------------------------
 # Auditing logic for student progress against BSCS degree requirements.
+# Fully annotated so it can be compiled with mypyc for batch audits. From the
+# repo root: `mypyc --explicit-package-bases engine/audit.py` (the flag is needed
+# because engine/ has no __init__.py; without it the extension is built as a
+# top-level `audit` module and `import engine.audit` keeps loading this file).
+# The compiled module keeps the same Python API.
 # ------------------------------------------------------------
 
-from typing import Dict, List, Any
-from engine.model import StudentProfile, RequirementBlock
-from engine.loader import load_courses, load_degree_requirements, load_policies
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, FrozenSet, Iterable, Optional, cast
+from engine.model import StudentProfile, Requirement, RequirementBlock, BlockAudit
+from engine.loader import load_courses, load_degree_requirements, load_policies, index_by_subject
+
+def _match_requirement(req: Requirement, completed: FrozenSet[str],
+                       by_prefix: Dict[str, List[str]]) -> Optional[str]:
+    """
+    Return what satisfied a requirement, or None if it is still missing.
+    Option and prefix matches return the course code; name matches return req.name.
+    """
+    # Case 1: explicit course options (C-level set test; scan options only once satisfied)
+    if req._options_upper and not req._options_upper.isdisjoint(completed):
+        #first match in catalog order, so the reported course is stable across runs
+        return next(o for o in req.options or () if o in completed)
+
+    # Case 2: requirement name matches a completed course
+    if req._name_upper in completed:
+        return req.name
+
+    # Case 3: allowed_prefixes match
+    return next((c for p in req._prefixes_tuple for c in by_prefix.get(p, ())), None)
 
 def audit_student(profile: StudentProfile) -> Dict[str, Any]:
     """
     Audit a student's progress toward BSCS degree requirements.
-    Returns a dict summarizing completed/missing requirements.
+    Returns a dict summarizing completed/missing requirements; "blocks" maps
+    each block name to a BlockAudit (BlockAudit.to_dict() gives the JSON form).
     """
     courses = load_courses()
     degree_blocks = load_degree_requirements()
-    policies = load_policies().get("policies", {})
+    policies = load_policies()
 
-    completed = set(c.upper() for c in profile.courses_done)
+    completed = frozenset(profile.courses_done)
+    by_prefix = index_by_subject(completed)
     total_credits = 0
-    block_results = {}
+    block_results: Dict[str, BlockAudit] = {}
 
     # count credits of completed courses
     for code in completed:
@@ -27,47 +53,48 @@ def audit_student(profile: StudentProfile) -> Dict[str, Any]:
 
     # check each requirement block
     for block_name, block in degree_blocks.items():
-        block_status = {
-            "completed": [],
-            "missing": [],
-            "credits_required": sum(r.credits for r in block.requirements),
-            "credits_done": 0
-        }
+        # both lists are bounded by the requirement count: preallocate and slice
+        n = len(block.requirements)
+        done: List[Optional[str]] = [None] * n
+        missing: List[Optional[str]] = [None] * n
+        n_done = n_missing = credits_done = 0
 
         for req in block.requirements:
-            satisfied = False
-
-            # Case 1: explicit course options
-            if req.options and any(opt.upper() in completed for opt in req.options):
-                satisfied = True
-                block_status["completed"].append(req.name)
-
-            # Case 2: requirement name matches a completed course
-            elif any(req.name.upper() == code for code in completed):
-                satisfied = True
-                block_status["completed"].append(req.name)
+            m = _match_requirement(req, completed, by_prefix)
+            if m is None:
+                missing[n_missing] = req.name
+                n_missing += 1
+            else:
+                done[n_done] = req.name if m == req.name else f"{req.name} ({m})"
+                n_done += 1
+                credits_done += req.credits
 
-            # Case 3: allowed_prefixes match
-            elif req.allowed_prefixes:
-                match = [c for c in completed if any(c.startswith(p) for p in req.allowed_prefixes)]
-                if match:
-                    satisfied = True
-                    block_status["completed"].append(f"{req.name} ({match[0]})")
-
-            # Mark missing if not satisfied
-            if not satisfied:
-                block_status["missing"].append(req.name)
-
-            # Credit counting
-            if satisfied:
-                block_status["credits_done"] += req.credits
-
-        block_results[block_name] = block_status
+        block_results[block_name] = BlockAudit(
+            credits_required=block.credits_required,
+            credits_done=credits_done,
+            # every slot below the cursor has been filled
+            completed=cast(List[str], done[:n_done]),
+            missing=cast(List[str], missing[:n_missing]),
+        )
 
     # overall result
     return {
         "catalog_year": profile.catalog_year,
         "credits_done": total_credits,
-        "credits_required": policies.get("min_total_credits", 127),
+        "credits_required": policies.min_total_credits,
         "blocks": block_results
     }
+
+def _warm_caches() -> None:
+    """Worker initializer: load the memoized catalogs once before serving audits."""
+    load_courses()
+    load_degree_requirements()
+    load_policies()
+
+def audit_students(profiles: Iterable[StudentProfile], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Audit many students in parallel worker processes.
+    Results are returned in the same order as the input profiles.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_caches) as executor:
+        return list(executor.map(audit_student, profiles, chunksize=64))
@@ -0,0 +1,63 @@
+# engine/cohort.py
+# ------------------------------------------------------------
+# Vectorized requirement checks for whole cohorts of students.
+# Completed-course sets become uint64 bitmasks over a shared course
+# vocabulary, so every student is tested against every requirement
+# in a single NumPy expression. Requires numpy.
+# ------------------------------------------------------------
+
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+from engine.model import StudentProfile
+from engine.loader import load_degree_requirements, index_by_subject
+
+def _pack(rows: List[List[int]], nwords: int) -> np.ndarray:
+    """Pack per-row lists of course ids into a (len(rows), nwords) uint64 bitmask."""
+    masks = np.zeros((len(rows), nwords), dtype=np.uint64)
+    row_idx = np.fromiter((r for r, ids in enumerate(rows) for _ in ids), dtype=np.intp)
+    ids = np.fromiter((i for ids in rows for i in ids), dtype=np.intp)
+    bits = np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64))
+    np.bitwise_or.at(masks, (row_idx, ids >> 6), bits)
+    return masks
+
+def cohort_satisfaction(profiles: Iterable[StudentProfile]) -> Tuple[List[Tuple[str, str]], np.ndarray]:
+    """
+    Check every student against every degree requirement at once.
+    Returns (keys, satisfied) where keys[j] = (block name, requirement name) and
+    satisfied[i, j] is True when student i meets requirement j (same rules as audit_student).
+    """
+    completed_sets = [frozenset(p.courses_done) for p in profiles]
+
+    #vocabulary = every code some student completed; nothing else can satisfy a requirement
+    vocab: Dict[str, int] = {}
+    for completed in completed_sets:
+        for code in completed:
+            vocab.setdefault(code, len(vocab))
+    by_prefix = index_by_subject(frozenset(vocab))
+
+    keys: List[Tuple[str, str]] = []
+    req_rows: List[List[int]] = []
+    for block_name, block in load_degree_requirements().items():
+        for req in block.requirements:
+            codes = set(req._options_upper)
+            codes.add(req._name_upper)
+            for p in req._prefixes_tuple:
+                codes.update(by_prefix.get(p, ()))
+            keys.append((block_name, req.name))
+            req_rows.append([vocab[c] for c in codes if c in vocab])
+
+    nwords = max(1, (len(vocab) + 63) // 64)
+    student_mask = _pack([[vocab[c] for c in completed] for completed in completed_sets], nwords)
+    req_mask = _pack(req_rows, nwords)
+
+    #(students, 1, words) & (1, reqs, words) -> any bit set per (student, requirement)
+    satisfied = (student_mask[:, None, :] & req_mask[None, :, :]).any(axis=2)
+    return keys, satisfied
+
+def missing_rates(profiles: Iterable[StudentProfile]) -> Dict[Tuple[str, str], float]:
+    """Fraction of the cohort still missing each requirement, keyed by (block, requirement)."""
+    keys, satisfied = cohort_satisfaction(profiles)
+    if not satisfied.shape[0]:
+        return {k: 0.0 for k in keys}
+    rates = 1.0 - satisfied.mean(axis=0)
+    return dict(zip(keys, rates.tolist()))
@@ -11,10 +11,27 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-import json
+import functools
+import math
+import mmap
+import os
+import pickle
 import re
-from typing import Dict, List, Any, Optional
-from engine.model import Course, Requirement, RequirementBlock
+import tempfile
+from dataclasses import fields
+from typing import Dict, List, Any, Callable, FrozenSet, Optional, Sequence, Tuple, TypeVar
+
+#orjson is optional; it parses straight from bytes and is noticeably faster
+_loads: Callable[[Any], Any]
+try:
+    import orjson
+    _loads = orjson.loads
+    _HAS_ORJSON = True
+except ImportError:
+    import json
+    _loads = json.loads
+    _HAS_ORJSON = False
+from engine.model import Course, Requirement, RequirementBlock, Policies
 
 #path setup
 BASE = Path(__file__).resolve().parents[1] / "data" / "olemiss" / "bscs" / "2024-2025"
@@ -28,29 +45,114 @@ DEGREE_REQUIREMENTS_FILE = BASE / "degree_requirements.json"
 FOUR_YEAR_PLAN_FILE = BASE / "four_year_plan.json"
 POLICIES_FILE = BASE / "policies.json"
 
+#pickled parse results, reused while the source files (and this engine code) are unchanged
+COURSES_CACHE_FILE = BASE / ".courses.cache.pkl"
+DEGREE_REQUIREMENTS_CACHE_FILE = BASE / ".degree_requirements.cache.pkl"
+_ENGINE_FILES = [Path(__file__), Path(__file__).with_name("model.py")]
+#process umask, read once at import (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+#below this size mmap setup costs more than a plain read
+MMAP_MIN_BYTES = 64 * 1024
+
+T = TypeVar("T")
+
 #loader helpers
+def _pickle_cached(cache_file: Path, sources: Sequence[Path], build: Callable[[], T]) -> T:
+    """
+    Return build() from a pickle keyed by source mtimes; rebuild and rewrite it when stale.
+    Whatever pickle sits at cache_file is unpickled, so the data directory must be trusted.
+    """
+    key = tuple(p.stat().st_mtime_ns if p.exists() else None for p in [*sources, *_ENGINE_FILES])
+    try:
+        with open(cache_file, "rb") as f:
+            #key is pickled first so a stale cache is rejected without loading the payload
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except Exception:
+        pass
+
+    value = build()
+    try:
+        #unique temp file per writer, so concurrent first loads never share one
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name, suffix=".tmp")
+    except OSError:
+        #read-only or missing data dir: just skip caching
+        return value
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(key, f, protocol=5)
+            pickle.dump(value, f, protocol=5)
+        #mkstemp creates 0600; open it up like a normal file so other accounts can read the cache
+        os.chmod(tmp, 0o644 & ~_UMASK)
+        os.replace(tmp, cache_file)
+    except Exception:
+        #never leave a half-written temp file behind
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+    return value
+
+#latest parse per file: path -> ((mtime_ns, size), data); older parses are dropped
+_json_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
 def load_json(path: Path) -> Any:
-    """Load JSON file safely; return empty dict/list on missing or parse error."""
-    if not path.exists():
+    """
+    Load JSON file safely; return empty dict/list on missing or parse error.
+    The parsed object is cached and shared between callers, so treat it as read-only.
+    """
+    try:
+        st = path.stat()
+    except OSError:
         return {}
+    #re-parsed when the file's mtime/size change. The catalog loaders below are
+    #memoized on top of this, so they only see edits after reload_catalog().
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _json_cache.get(str(path))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    data = _parse_json_file(str(path), st.st_size)
+    _json_cache[str(path)] = (key, data)
+    return data
+
+def _parse_json_file(path: str, size: int) -> Any:
+    """Parse a JSON file, memory-mapping large files when orjson is available."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        if _HAS_ORJSON and size >= MMAP_MIN_BYTES:
+            return _load_json_mapped(path)
+        return _loads(Path(path).read_bytes())
     except Exception:
         return {}
 
+def _load_json_mapped(path: str) -> Any:
+    """Parse a large JSON file straight from a read-only memory map (orjson only)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+            return _loads(buf)
+    finally:
+        os.close(fd)
+
 _course_code_re = re.compile(r'([A-Za-z]{2,4}\s*\d{3}[A-Za-z]?)', re.IGNORECASE)
-_credits_re = re.compile(r'(\d+(?:\.\d+)?)(?:\s*-\s*\d+(?:\.\d+)?)?\s+credits?', re.IGNORECASE)
-_numeric_re = re.compile(r'(\d+(?:\.\d+)?)')
+_plain_number_re = re.compile(r'\d+(?:\.\d+)?')
+#one pass: prefer the earliest "N credits"/"N-M credits" phrase, else the first number
+_credits_re = re.compile(
+    r'.*?(?P<credits>\d+(?:\.\d+)?)(?:\s*-\s*\d+(?:\.\d+)?)?\s+credits?'
+    r'|.*?(?P<number>\d+(?:\.\d+)?)',
+    re.IGNORECASE | re.DOTALL,
+)
 
 def _extract_code(raw_code: Optional[str], title: Optional[str]) -> str:
     """Try code field first, otherwise extract from title (e.g. 'Csci 111: Name')."""
     if raw_code:
-        return raw_code.strip().upper()
+        return sys.intern(raw_code.strip().upper())
     if not title:
         return ""
     m = _course_code_re.search(title)
-    return m.group(1).upper() if m else title.strip().upper()
+    #interned so set/dict lookups against other interned codes hit the identity fast path
+    return sys.intern(m.group(1).upper() if m else title.strip().upper())
 
 def _extract_name(title: Optional[str]) -> str:
     """Return a cleaned course name (remove leading code if present)."""
@@ -71,40 +173,78 @@ def _parse_credits(raw: Any) -> int:
     s = str(raw).strip()
     if not s:
         return 0
-    #look for patterns like "3 credits", "3-4 credits", "3.0 credits"
-    m = _credits_re.search(s)
+    #fast path: plain numeric strings like "3" or "3.0" (the common case)
+    if _plain_number_re.fullmatch(s):
+        return int(float(s))
+    #look for patterns like "3 credits", "3-4 credits", "3.0 credits", else any first number
+    m = _credits_re.match(s)
     if m:
         try:
-            return int(float(m.group(1)))
-        except Exception:
-            pass
-    #fallback: any first number
-    m2 = _numeric_re.search(s)
-    if m2:
-        try:
-            return int(float(m2.group(1)))
+            return int(float(m.group("credits") or m.group("number")))
         except Exception:
             pass
     return 0
 
-def _normalize_prereqs(raw: Any) -> List[str]:
-    """Return prerequisites as list of strings (empty list if none)."""
+#";", "." or "," (optionally followed by "or"/"and"); factored so the engine never backtracks
+_prereq_split_re = re.compile(r'\s*(?:;|\.|,(?:\s*(?:or|and))?)\s*')
+
+@functools.lru_cache(maxsize=1024)
+def _split_prereqs(s: str) -> tuple:
+    """Split a prerequisite sentence; cached since cross-listed courses repeat the same text."""
+    #split common separators but keep phrase if it's a sentence
+    parts = [p.strip() for p in _prereq_split_re.split(s) if p.strip()]
+    return tuple(parts) if parts else (s,)
+
+def _normalize_prereqs(raw: Any) -> Tuple[str, ...]:
+    """Return prerequisites as tuple of strings (empty tuple if none)."""
     if not raw:
-        return []
+        return ()
     if isinstance(raw, list):
-        return [str(x).strip() for x in raw if str(x).strip()]
-    s = str(raw).strip()
-    #split common separators but keep phrase if it's a sentence
-    parts = re.split(r'\s*;\s*|\s*\.\s*|\s*,\s*or\s*|\s*,\s*and\s*|\s*,\s*', s)
-    parts = [p.strip() for p in parts if p.strip()]
-    return parts if parts else [s]
+        return tuple(str(x).strip() for x in raw if str(x).strip())
+    return _split_prereqs(str(raw).strip())
+
+def _canonical_codes(raw: Any) -> Optional[Tuple[str, ...]]:
+    """Strip, upper-case and intern a JSON list of course codes or prefixes (None stays None)."""
+    codes = _as_tuple(raw)
+    return tuple(sys.intern(str(c).strip().upper()) for c in codes) if codes is not None else None
+
+def _as_tuple(raw: Any) -> Optional[tuple]:
+    """Freeze an optional JSON list into a tuple for the frozen models (None stays None)."""
+    if raw is None:
+        return None
+    return tuple(raw) if isinstance(raw, (list, tuple)) else (raw,)
+
+_subject_re = re.compile(r'^(.*?)\s*\d')
+
+def index_by_subject(codes: FrozenSet[str]) -> Dict[str, List[str]]:
+    """Bucket course codes by subject prefix (e.g. 'CSCI 111' -> 'CSCI', 'EL E 235' -> 'EL E')."""
+    by_prefix: Dict[str, List[str]] = {}
+    #sorted so each bucket (and the course reported for a prefix match) is stable across runs
+    for code in sorted(codes):
+        m = _subject_re.match(code)
+        by_prefix.setdefault(m.group(1) if m else code, []).append(code)
+    return by_prefix
+
+def _prepare_matchers(req: Requirement) -> None:
+    """Precompute case-folded, interned matchers once so audits only do set/tuple lookups."""
+    object.__setattr__(req, "_name_upper", sys.intern(req.name.upper()))
+    object.__setattr__(req, "_options_upper", frozenset(sys.intern(o) for o in req.options or ()))
+    object.__setattr__(req, "_prefixes_tuple", req.allowed_prefixes or ())
 
 #loader functions
+@functools.lru_cache(maxsize=None)
 def load_courses() -> Dict[str, Course]:
     """
     Load courses from multiple JSON files and merge into a dictionary.
     Key = course code (e.g., 'CSCI 111'), Value = Course object.
+    Reuses (unpickles) COURSES_CACHE_FILE from the data directory, which must be trusted.
     """
+    courses = _pickle_cached(COURSES_CACHE_FILE, COURSE_FILES, _build_courses)
+    #unpickled strings are not interned; re-intern the lookup keys
+    return {sys.intern(code): c for code, c in courses.items()}
+
+def _build_courses() -> Dict[str, Course]:
+    """Parse the course JSON files (the slow path behind load_courses)."""
     courses: Dict[str, Course] = {}
     for file in COURSE_FILES:
         raw = load_json(file)
@@ -128,17 +268,27 @@ def load_courses() -> Dict[str, Course]:
                 credits=credits_val,
                 description=c.get("description") or "",
                 prerequisites=prereqs,
-                semester_offered=c.get("semester_offered"),
-                attributes=c.get("attributes") or []
+                semester_offered=_as_tuple(c.get("semester_offered")),
+                attributes=_as_tuple(c.get("attributes")) or ()
             )
             courses[code] = course
     return courses
 
+@functools.lru_cache(maxsize=None)
 def load_degree_requirements() -> Dict[str, RequirementBlock]:
     """
     Load degree requirements from JSON and normalize to RequirementBlock objects.
     Returns a dict keyed by block name.
+    Reuses (unpickles) DEGREE_REQUIREMENTS_CACHE_FILE from the data directory, which must be trusted.
     """
+    blocks = _pickle_cached(DEGREE_REQUIREMENTS_CACHE_FILE, [DEGREE_REQUIREMENTS_FILE], _build_degree_requirements)
+    for block in blocks.values():
+        for req in block.requirements:
+            _prepare_matchers(req)
+    return blocks
+
+def _build_degree_requirements() -> Dict[str, RequirementBlock]:
+    """Parse the degree requirements JSON (the slow path behind load_degree_requirements)."""
     data = load_json(DEGREE_REQUIREMENTS_FILE) or {}
     blocks: Dict[str, RequirementBlock] = {}
 
@@ -150,26 +300,74 @@ def load_degree_requirements() -> Dict[str, RequirementBlock]:
                 cred = int(r.get("credits") or 0)
             except Exception:
                 cred = 0
-            reqs.append(
-                Requirement(
-                    name=r.get("name") or r.get("course") or "Unnamed",
-                    credits=cred,
-                    options=r.get("options"),
-                    allowed_prefixes=r.get("allowed_prefixes"),
-                    exclusions=r.get("exclusions"),
-                    prerequisites=r.get("prerequisites"),
-                    filter=r.get("filter"),
-                    notes=r.get("notes"),
-                )
+            req = Requirement(
+                name=r.get("name") or r.get("course") or "Unnamed",
+                credits=cred,
+                options=_canonical_codes(r.get("options")),
+                allowed_prefixes=_canonical_codes(r.get("allowed_prefixes")),
+                exclusions=_as_tuple(r.get("exclusions")),
+                prerequisites=_as_tuple(r.get("prerequisites")),
+                filter=r.get("filter"),
+                notes=r.get("notes"),
             )
-        blocks[block_name] = RequirementBlock(name=block_name, requirements=reqs)
+            reqs.append(req)
+        blocks[block_name] = RequirementBlock(
+            name=block_name,
+            requirements=reqs,
+            credits_required=sum(r.credits for r in reqs),
+        )
     return blocks
 
+@functools.lru_cache(maxsize=None)
 def load_four_year_plan() -> dict:
     """Load the standard four-year advising plan (raw JSON dict)."""
     return load_json(FOUR_YEAR_PLAN_FILE) or {}
 
-def load_policies() -> dict:
-    """Load program policies (raw JSON dict)."""
-    return load_json(POLICIES_FILE) or {}
+_int_re = re.compile(r'\d+')
+
+def _policy_value(v: Any, typ: type) -> Optional[Any]:
+    """Strictly convert a policy value to int/float; None when it doesn't fit (bools never do)."""
+    if isinstance(v, bool):
+        return None
+    if typ is int:
+        if isinstance(v, int):
+            return v
+        if isinstance(v, str) and _int_re.fullmatch(v.strip()):
+            return int(v.strip())
+        return None
+    if isinstance(v, (int, float, str)):
+        try:
+            f = float(v)
+        except ValueError:
+            return None
+        return f if math.isfinite(f) else None
+    return None
+
+@functools.lru_cache(maxsize=None)
+def load_policies() -> Policies:
+    """Load program policies into a Policies object (defaults for anything missing or malformed)."""
+    raw = (load_json(POLICIES_FILE) or {}).get("policies") or {}
+    typed = {f.name: f.type for f in fields(Policies) if f.type in (int, float)}
+    values: Dict[str, Any] = {}
+    text: Dict[str, str] = {}
+    extra: Dict[str, Any] = {}
+    for k, v in raw.items():
+        if k in typed:
+            #coerce to the declared type ("127" -> 127); keep the default if it doesn't fit
+            val = _policy_value(v, typed[k])
+            if val is not None:
+                values[k] = val
+        elif isinstance(v, str):
+            text[k] = v
+        else:
+            extra[k] = v
+    return Policies(**values, text=text, extra=extra)
+
+def reload_catalog() -> None:
+    """Drop all memoized catalog data so the next load re-reads the JSON files."""
+    _json_cache.clear()
+    load_courses.cache_clear()
+    load_degree_requirements.cache_clear()
+    load_four_year_plan.cache_clear()
+    load_policies.cache_clear()
 # ......
\ No newline at end of file
@@ -11,12 +11,13 @@
 # auditor, and API layers. Keeping them clear and consistent ensures
 # the rest of the system can evolve without breaking.
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Literal
+from typing import Any, List, Dict, Optional, Literal, FrozenSet, Sequence, Tuple
 
 # Course & Catalog
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Course:
     """
     Represents a single course as listed in the catalog.
@@ -25,13 +26,13 @@ class Course:
     name: str                                #e.g., "Computer Science I"
     credits: int                             #credit hours
     description: Optional[str] = None        #course description(may be long text)
-    prerequisites: List[str] = field(default_factory=list)  #list of prerequisite course codes
-    semester_offered: Optional[List[Literal["Fall","Spring","Summer"]]] = None
-    attributes: List[str] = field(default_factory=list)     #tags like "Lab Science", "Elective"
+    prerequisites: Tuple[str, ...] = ()      #prerequisite course codes
+    semester_offered: Optional[Tuple[Literal["Fall","Spring","Summer"], ...]] = None
+    attributes: Tuple[str, ...] = ()         #tags like "Lab Science", "Elective"
 
 # Degree Requirement Blocks
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Requirement:
     """
     Represents one specific requirement inside a requirement block.
@@ -42,12 +43,16 @@ class Requirement:
     """
     name: str
     credits: int
-    options: Optional[List[str]] = None               #explicit course options
-    allowed_prefixes: Optional[List[str]] = None        #e.g., ["MUS","THEA"]
-    exclusions: Optional[List[str]] = None              #strings to exclude (e.g., "studio")
-    prerequisites: Optional[List[str]] = None           #prereq course codes
-    filter: Optional[Dict] = None                     #e.g., {"prefix":"CSCI","min_level":300}
+    options: Optional[Tuple[str, ...]] = None           #explicit course options
+    allowed_prefixes: Optional[Tuple[str, ...]] = None  #e.g., ("MUS","THEA")
+    exclusions: Optional[Tuple[str, ...]] = None        #strings to exclude (e.g., "studio")
+    prerequisites: Optional[Tuple[str, ...]] = None     #prereq course codes
+    filter: Optional[Dict] = field(default=None, hash=False)  #e.g., {"prefix":"CSCI","min_level":300}
     notes: Optional[str] = None                       #free-form note for human/LLM
+    #case-folded matchers filled in by the loader so audits skip per-call normalization
+    _name_upper: str = field(default="", init=False, repr=False, compare=False)
+    _options_upper: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _prefixes_tuple: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
 
 @dataclass
 class RequirementBlock:
@@ -60,37 +65,81 @@ class RequirementBlock:
     """
     name: str
     requirements: List[Requirement]
+    credits_required: int = 0     #sum of requirement credits, computed by the loader
+
+# Program Policies
+
+@dataclass(slots=True, frozen=True)
+class Policies:
+    """
+    Program-wide advising policies (the "policies" object in policies.json).
+    Numeric limits are typed fields; prose policies are kept by key in `text`,
+    and any other unrecognized entries in `extra`.
+    """
+    credit_min_fulltime: int = 12          #minimum hours for full-time status
+    credit_max_standard: int = 19          #max hours per term without overload approval
+    credit_max_overload: int = 22          #max hours per term with overload approval
+    overload_gpa_threshold: float = 3.0    #GPA needed to request an overload
+    min_total_credits: int = 127           #hours required to graduate
+    school_gpa_min: float = 2.0            #minimum GPA to remain in good standing
+    text: Dict[str, str] = field(default_factory=dict, hash=False)  #e.g., {"speech_policy": "..."}
+    extra: Dict[str, Any] = field(default_factory=dict, hash=False)  #unrecognized non-string entries, as loaded
 
 # Student Profile (input)
 
-@dataclass
+@dataclass(slots=True)
 class StudentProfile:
     """
     Represents the student input for generating an academic plan.
     This will typically be provided by the API (from chat input or UI).
     """
     catalog_year: str
-    courses_done: List[str] = field(default_factory=list)  #courses already completed
+    courses_done: Sequence[str] = ()       #courses already completed (canonicalized to an upper-case tuple)
     remaining_terms: int = 8               #how many terms left (default = 4 years)
     target_hours: int = 16           # preferred average load per term
     max_hours: int = 19        #maximum hours allowed per term
     gpa: Optional[float] = None            #current GPA, for overload checks
     emphasis: Optional[str] = None    #"data_science", "computer_security", or None
 
+    def __post_init__(self) -> None:
+        #canonicalize and intern once on ingestion so the audit compares codes as-is
+        self.courses_done = tuple(sys.intern(c.strip().upper()) for c in self.courses_done)
+
+# Audit Output (engine -> API)
+
+@dataclass(slots=True)
+class BlockAudit:
+    """
+    Audit result for one requirement block.
+    """
+    credits_required: int
+    credits_done: int = 0
+    completed: List[str] = field(default_factory=list)   #satisfied requirements (with matched course if any)
+    missing: List[str] = field(default_factory=list)     #requirements still open
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow, JSON-ready form for the API layer (lists are shared, not copied)."""
+        return {
+            "completed": self.completed,
+            "missing": self.missing,
+            "credits_required": self.credits_required,
+            "credits_done": self.credits_done,
+        }
+
 # Plan Output(engine -> API)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanRow:
     """
     One row inside a term's plan (i.e., one course recommendation).
     """
     course: str
     hours: int
-    prereq: List[str] = field(default_factory=list)    #prerequisites for this course
-    notes: List[str] = field(default_factory=list)     #advisory notes (e.g., "Fall only")
+    prereq: Tuple[str, ...] = ()         #prerequisites for this course
+    notes: Tuple[str, ...] = ()          #advisory notes (e.g., "Fall only")
     prereq_met: Optional[bool] = None    #computed by prereq checker
 
-@dataclass
+@dataclass(slots=True)
 class PlanTerm:
     """
     Represents a single academic term (Fall/Spring/Summer).
@@ -111,4 +160,4 @@ class PlanResult:
     catalog_year: str
     remaining_terms: int
     terms: List[PlanTerm] #full plan (remaining terms only)
-    audit: Dict  #audit summary (credits completed, missing blocks, warnings)
+    audit: Dict  #audit summary from audit_student; "blocks" values are BlockAudit (use to_dict() for JSON)